@@ -0,0 +1,49 @@
+import asyncio
+from typing import Any, AsyncIterator
+
+import pytest
+
+from tg_chat_parser.crawler import MessagesQueue, fetch_messages
+from tg_chat_parser.settings import settings
+
+
+class StubMessage:
+    def __init__(self, id: int) -> None:
+        self.id = id
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"id": self.id}
+
+
+class StubClient:
+    def __init__(self, count: int) -> None:
+        self.count = count
+
+    async def iter_messages(
+        self, channel: Any, **kwargs: Any
+    ) -> AsyncIterator[StubMessage]:
+        for id in range(self.count):
+            yield StubMessage(id)
+
+
+async def collect_batches(count: int) -> list[Any]:
+    queue: MessagesQueue = asyncio.Queue()
+    await fetch_messages(StubClient(count), None, queue)
+    return [queue.get_nowait() for _ in range(queue.qsize())]
+
+
+def test_fetch_messages_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "MESSAGE_REQUEST_LIMIT", 2)
+
+    batches = asyncio.run(collect_batches(5))
+
+    assert batches == [
+        [{"id": 0}, {"id": 1}],
+        [{"id": 2}, {"id": 3}],
+        [{"id": 4}],
+        None,
+    ]
+
+
+def test_fetch_messages_without_messages() -> None:
+    assert asyncio.run(collect_batches(0)) == [None]
@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from tg_chat_parser.database.db import jsonb_decoder, jsonb_encoder
+
+
+def test_jsonb_round_trip() -> None:
+    message = {
+        "file_reference": b"\x00\xff",
+        "date": datetime(2023, 8, 11, 20, 45, 32),
+    }
+
+    data = jsonb_encoder(message)
+
+    assert data.startswith(b"\x01")
+    assert jsonb_decoder(data) == {
+        "file_reference": "AP8=",
+        "date": "2023-08-11T20:45:32+00:00",
+    }
@@ -4,6 +4,7 @@ import logging518.config
 from telethon import TelegramClient
 
 from tg_chat_parser.crawler import worker
+from tg_chat_parser.database.db import create_pg_pool
 from tg_chat_parser.settings import settings
 
 
@@ -13,11 +14,12 @@ async def main() -> None:
         api_id=settings.TG_API_ID,
         api_hash=settings.TG_API_HASH,
         auto_reconnect=True,
+        flood_sleep_threshold=settings.TG_FLOOD_SLEEP_THRESHOLD,
         sequential_updates=True,
         lang_code="ru",
     )
-    async with tg_client:
-        await worker(client=tg_client)
+    async with tg_client, create_pg_pool() as pg_pool:
+        await worker(client=tg_client, pg_pool=pg_pool)
 
 
 if __name__ == "__main__":
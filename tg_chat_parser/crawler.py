@@ -1,49 +1,53 @@
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from asyncpg import Pool
 from telethon import TelegramClient
-from telethon.tl.functions.messages import GetHistoryRequest
-from telethon.tl.types.messages import ChannelMessages
 
-from tg_chat_parser.database.db import get_session
-from tg_chat_parser.database.shemas import Message
+from tg_chat_parser.database.queries import copy_messages
 from tg_chat_parser.settings import settings
 
 if TYPE_CHECKING:
-    from sqlalchemy.ext.asyncio import AsyncSession  # noqa:F401
+    from telethon.tl.types import TypeInputPeer
 
 logger = logging.getLogger(__name__)
 
+MessagesQueue = asyncio.Queue[list[dict[str, Any]] | None]
 
-async def worker(client: TelegramClient) -> None:
-    channel = await client.get_entity(str(settings.CHANNEL_URL))
-    total_messages_count = 0
-    offset_msg_id = settings.MESSAGE_OFFSET
-    while total_messages_count <= settings.MESSAGE_LIMIT:
-        history: ChannelMessages = await client(
-            GetHistoryRequest(
-                peer=channel,  # noqa
-                offset_id=offset_msg_id,
-                offset_date=settings.DATE_OFFSET,
-                add_offset=0,
-                limit=settings.MESSAGE_REQUEST_LIMIT,
-                max_id=0,
-                min_id=0,
-                hash=0,
-            )
-        )
-        if not history.messages:
-            break
-        messages = history.messages
-        if not messages:
-            break
-        total_messages_count += len(messages)
-        offset_msg_id = messages[-1].id
-        messages_to_create = []
-        for message in messages:
-            message_dict = message.to_dict()
-            logger.info(message_dict)
-            messages_to_create.append(Message(message_raw=message_dict))
-        async with get_session() as session:  # type: AsyncSession
-            session.add_all(messages_to_create)
-            await session.commit()
+
+async def worker(client: TelegramClient, pg_pool: Pool) -> None:
+    channel = await client.get_input_entity(str(settings.CHANNEL_URL))
+    queue: MessagesQueue = asyncio.Queue(maxsize=settings.MESSAGE_QUEUE_SIZE)
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(fetch_messages(client, channel, queue))
+        tg.create_task(store_messages(pg_pool, queue))
+
+
+async def fetch_messages(
+    client: TelegramClient, channel: "TypeInputPeer", queue: MessagesQueue
+) -> None:
+    batch: list[dict[str, Any]] = []
+    async for message in client.iter_messages(
+        channel,
+        limit=settings.MESSAGE_LIMIT,
+        offset_id=settings.MESSAGE_OFFSET,
+        offset_date=settings.DATE_OFFSET,
+        wait_time=0,
+    ):
+        message_dict = message.to_dict()
+        logger.debug("Fetched message %s", message_dict)
+        batch.append(message_dict)
+        if len(batch) >= settings.MESSAGE_REQUEST_LIMIT:
+            await queue.put(batch)
+            batch = []
+    if batch:
+        await queue.put(batch)
+    await queue.put(None)
+
+
+async def store_messages(pg_pool: Pool, queue: MessagesQueue) -> None:
+    while (batch := await queue.get()) is not None:
+        async with pg_pool.acquire() as connection:
+            await copy_messages(connection, batch)
+        logger.info("Saved %d messages", len(batch))
@@ -1,8 +1,11 @@
+import base64
 import logging
 from contextlib import asynccontextmanager
 from typing import Any, AsyncGenerator
 
+import asyncpg
 import orjson
+from sqlalchemy import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -11,16 +14,44 @@ from sqlalchemy.ext.asyncio import (
 
 from tg_chat_parser.settings import settings
 
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+PG_SERVER_SETTINGS = {
+    # JIT only slows down asyncpg's type introspection on fresh connections.
+    "jit": "off",
+}
+
+
+def orjson_default(obj: Any) -> str:
+    """
+    Telethon `to_dict()` keeps raw `bytes` (file references, thumbs), encode them like Telethon's `to_json()`.
+    """
+    if isinstance(obj, bytes):
+        return base64.b64encode(obj).decode("ascii")
+    raise TypeError
+
 
 def orjson_serializer(obj: Any) -> str:
     """
     Note that `orjson.dumps()` return byte array, while sqlalchemy expects string, thus `decode()` call.
     """
     return orjson.dumps(
-        obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+        obj, default=orjson_default, option=ORJSON_OPTIONS
     ).decode()
 
 
+def jsonb_encoder(obj: Any) -> bytes:
+    """
+    JSONB binary format is a version byte followed by the UTF-8 JSON text.
+    """
+    return b"\x01" + orjson.dumps(
+        obj, default=orjson_default, option=ORJSON_OPTIONS
+    )
+
+
+def jsonb_decoder(data: bytes) -> Any:
+    return orjson.loads(data[1:])
+
+
 engine = create_async_engine(
     str(settings.PG_DSN),
     echo=settings.DEBUG,
@@ -28,10 +59,15 @@ engine = create_async_engine(
     hide_parameters=not settings.DEBUG,
     pool_size=settings.PG_POOL_SIZE,
     max_overflow=settings.PG_MAX_POOL_SIZE,
-    isolation_level="SERIALIZABLE",
+    # Writes are append-only, so SSI conflict tracking buys nothing here.
+    # Use `session.connection(execution_options={"isolation_level": ...})`
+    # for the rare transaction that needs SERIALIZABLE.
+    isolation_level="READ COMMITTED",
     pool_pre_ping=True,
-    pool_recycle=3600,
-    json_deserializer=orjson.dumps,
+    pool_recycle=1800,
+    pool_use_lifo=True,
+    connect_args={"server_settings": PG_SERVER_SETTINGS},
+    json_deserializer=orjson.loads,
     json_serializer=orjson_serializer,
 )
 
@@ -43,6 +79,30 @@ async_session = async_sessionmaker(
 logger = logging.getLogger(__name__)
 
 
+async def init_pg_connection(connection: asyncpg.Connection) -> None:
+    await connection.set_type_codec(
+        "jsonb",
+        encoder=jsonb_encoder,
+        decoder=jsonb_decoder,
+        schema="pg_catalog",
+        format="binary",
+    )
+
+
+def create_pg_pool() -> asyncpg.Pool:
+    """
+    Raw asyncpg pool for the write-heavy crawler path, where the ORM session is not needed.
+    """
+    dsn = make_url(str(settings.PG_DSN)).set(drivername="postgresql")
+    return asyncpg.create_pool(
+        dsn=dsn.render_as_string(hide_password=False),
+        min_size=1,
+        max_size=settings.PG_POOL_SIZE,
+        server_settings=PG_SERVER_SETTINGS,
+        init=init_pg_connection,
+    )
+
+
 @asynccontextmanager
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session() as session:
@@ -0,0 +1,3 @@
+from .messages import copy_messages
+
+__all__ = ["copy_messages"]
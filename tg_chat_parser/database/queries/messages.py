@@ -0,0 +1,18 @@
+from typing import Any, Sequence
+
+from asyncpg import Connection
+
+from tg_chat_parser.database.shemas import Message
+
+
+async def copy_messages(
+    connection: Connection, messages: Sequence[dict[str, Any]]
+) -> None:
+    """
+    Bulk load raw messages through asyncpg `COPY` instead of ORM inserts.
+    """
+    await connection.copy_records_to_table(
+        Message.__tablename__,
+        records=[(message,) for message in messages],
+        columns=["message_raw"],
+    )
@@ -41,11 +41,14 @@ class Base(DeclarativeBase):
 class BaseSchema(Base):
     __abstract__ = True
 
-    id = mapped_column(BigInteger, primary_key=True)
-    created_at: Mapped[datetime] = mapped_column(insert_default=func.now())
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(
+        insert_default=func.now(),
+        server_default=func.now(),
+    )
     updated_at: Mapped[datetime] = mapped_column(
         server_default=func.now(),
-        onupdate=datetime.utcnow,
+        onupdate=func.now(),
     )
 
 
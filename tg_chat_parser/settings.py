@@ -17,10 +17,12 @@ class Settings(BaseSettings):
     MESSAGE_REQUEST_LIMIT: LimitedInt = (
         200 if MESSAGE_LIMIT > 200 else MESSAGE_LIMIT
     )
+    MESSAGE_QUEUE_SIZE: int = 10
     # Telegram
     TG_SESSION_NAME: str = "Crawler"
     TG_API_ID: int
     TG_API_HASH: str
+    TG_FLOOD_SLEEP_THRESHOLD: int = 300
     # Postgres
     PG_DSN: PostgresDsn
     PG_POOL_SIZE: int = 5